@@ -1,7 +1,11 @@
 import streamlit as st
 import pandas as pd
-import plotly.express as px
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pa_csv
 import io
+import os
 
 # --- PAGE CONFIGURATION ---
 st.set_page_config(
@@ -10,139 +14,202 @@ st.set_page_config(
 )
 
 # --- HELPER FUNCTIONS ---
-@st.cache_data
-def preprocess_data(df):
-    """Cleans and preprocesses the raw registration data."""
-    df['Created At'] = pd.to_datetime(df['Created At'], errors='coerce', utc=True)
-    df.dropna(subset=['Created At'], inplace=True)
+# Parsed uploads are cached in memory for an hour. Setting the environment
+# variable EVENT_DASHBOARD_PERSIST_CACHE=1 also persists them to disk
+# (~/.streamlit/cache), so re-uploading the same file skips parsing even from a
+# new session or after a restart. Disk entries contain registrant data and are
+# never evicted (Streamlit ignores ttl for them); delete them with
+# `streamlit cache clear`.
+PERSIST_UPLOAD_CACHE = os.environ.get('EVENT_DASHBOARD_PERSIST_CACHE') == '1'
 
-    df['Registration Date'] = df['Created At'].dt.date
-    df['Year of Study Cleaned'] = pd.to_numeric(df['Year of Study'], errors='coerce')
-    df.dropna(subset=['Year of Study Cleaned'], inplace=True)
-    df['Year of Study Cleaned'] = df['Year of Study Cleaned'].astype(int).astype(str)
-    return df
+@st.cache_data(
+    persist='disk' if PERSIST_UPLOAD_CACHE else None,
+    max_entries=32,
+    ttl=None if PERSIST_UPLOAD_CACHE else 3600,
+)
+def load_and_preprocess(raw):
+    """Parses and cleans the uploaded CSV bytes.
 
-    return df
+    Returns the cleaned DataFrame together with its earliest and latest
+    registration dates, so reruns don't rescan the column for the sidebar.
+    """
+    # All cleaning lives in this function body: Streamlit keys the cache on
+    # this function's source only, so any change here invalidates old entries.
+    # The Arrow reader skips rows with fewer fields than the header, whereas the
+    # default engine keeps them and pads the missing trailing fields with NaN.
+    # Note any short row so the upload can be reparsed the default way.
+    short_rows = []
+    def skip_bad_line(row):
+        if row.actual_columns < row.expected_columns:
+            short_rows.append(row.number)
+        return 'skip'
 
-@st.cache_data
-def to_csv(df):
-    """Converts a DataFrame to a CSV string for downloading."""
-    return df.to_csv(index=False).encode('utf-8')
+    try:
+        df = pd.read_csv(io.BytesIO(raw), engine='pyarrow', on_bad_lines=skip_bad_line, encoding='utf-8-sig')
+    except UnicodeDecodeError:
+        # Not valid UTF-8 (e.g. a Latin-1 export): the default engine can
+        # replace undecodable bytes instead of failing.
+        df = None
+    if df is None or short_rows:
+        df = pd.read_csv(io.BytesIO(raw), on_bad_lines='skip', encoding='utf-8-sig', encoding_errors='replace')
+    if df.empty:
+        return df, None, None
 
-# --- MAIN APPLICATION ---
-st.title("🎉 Event Registration Dashboard")
-st.markdown("Upload your registration CSV for an automated, in-depth analysis.")
+    df['Created At'] = pd.to_datetime(df['Created At'], errors='coerce', utc=True)
+    df['Registration Date'] = df['Created At'].dt.floor('D').dt.tz_localize(None)
+    df['Year of Study Cleaned'] = pd.to_numeric(df['Year of Study'], errors='coerce')
+    # Drop unusable rows in a single pass so the frame is only rebuilt once.
+    df.dropna(subset=['Created At', 'Year of Study Cleaned'], inplace=True)
+    df['Year of Study Cleaned'] = pd.to_numeric(df['Year of Study Cleaned'].astype(int), downcast='integer')
 
-uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+    # Low-cardinality columns are filtered and counted on every rerun; as
+    # categoricals those operations work on small integer codes. The inferred
+    # categories are sorted, so they double as the sidebar option lists.
+    for col in ('College Name', 'Gender', 'Degree', 'Year of Study Cleaned'):
+        df[col] = df[col].astype('category')
+    df['Registered Events'] = df['Registered Events'].astype('string[pyarrow]')
 
-if uploaded_file is None:
-    st.info("Please upload a CSV file to get started.", icon="👈")
-    st.stop()
+    # Internal flag for the "Completed Profiles" subset, computed once here
+    # rather than with a dropna() on every rerun. Hidden from the table and CSV.
+    df['_complete'] = df[['First Name', 'College Name', 'Gender']].notna().all(axis=1)
+    return df, df['Registration Date'].min(), df['Registration Date'].max()
 
-try:
-    # Read uploaded file robustly: decode bytes to UTF-8 (ignore errors),
-    # normalize newlines, and let pandas parse from a StringIO buffer.
-    content = uploaded_file.getvalue().decode('utf-8', errors='ignore')
-    content = content.replace('\r\n', '\n')
-    df_raw = pd.read_csv(io.StringIO(content), on_bad_lines='skip')
-    df_raw.columns = df_raw.columns.str.replace('\ufeff', '', regex=True)
-    if df_raw is None or df_raw.empty:
-        st.error("The uploaded CSV file is empty or could not be read.", icon="🚨")
-        st.stop()
-    df = preprocess_data(df_raw.copy())
-except Exception as e:
-    st.error(f"⚠️ Could not read the CSV file. Try re-saving it as UTF-8 format.\n\nError details: {e}")
-    st.stop()
+def count_values(series):
+    """Counts each value, most frequent first, ties in label order.
 
-# --- SIDEBAR FILTERS ---
-st.sidebar.header("Filter Your Data 👇")
-college_list = sorted(df['College Name'].dropna().unique())
-selected_colleges = st.sidebar.multiselect('Filter by College:', options=college_list, default=college_list)
-year_list = sorted(df['Year of Study Cleaned'].unique())
-selected_years = st.sidebar.multiselect('Filter by Year of Study:', options=year_list, default=year_list)
-min_date, max_date = df['Registration Date'].min(), df['Registration Date'].max()
-selected_date_range = st.sidebar.date_input('Filter by Registration Date:', value=(min_date, max_date), min_value=min_date, max_value=max_date)
+    Grouping with observed=True leaves out categories absent from the current
+    selection, which value_counts() would report with a count of zero.
+    """
+    counts = series.groupby(series, observed=True, sort=False).size()
+    # Order labels first so the stable count sort breaks ties alphabetically,
+    # independent of the order rows appear in the file.
+    return counts.sort_index().sort_values(ascending=False, kind='stable').rename('count')
 
-start_date, end_date = selected_date_range
-df_filtered = df[
-    (df['College Name'].isin(selected_colleges)) &
-    (df['Year of Study Cleaned'].isin(selected_years)) &
-    (df['Registration Date'] >= start_date) &
-    (df['Registration Date'] <= end_date)
-]
+# The aggregation helpers below take the frame as an underscore argument so
+# Streamlit does not hash it; the cached result is looked up by `key`, a small
+# fingerprint of the upload and the sidebar selections that produced the frame.
+# Keys are specific to one session's upload, so the caches are kept small and
+# short-lived to stop them growing with every filter change.
+@st.cache_data(max_entries=16, ttl=3600)
+def agg_daily(_df, key):
+    """Counts registrations per day."""
+    daily = _df.groupby('Registration Date', sort=False).size().sort_index().reset_index(name='Count')
+    return daily.rename(columns={'Registration Date': 'Date'})
 
-if df_filtered.empty:
-    st.warning("No data matches the current filter settings.")
-    st.stop()
+@st.cache_data(max_entries=64, ttl=3600)
+def agg_counts(_df, column, key):
+    """Counts registrations per value of a column."""
+    # Called for several columns per filter and its results are tiny, so it
+    # gets more entries than the frame-sized caches around it.
+    return count_values(_df[column])
 
-# --- DASHBOARD UI ---
-st.markdown("---")
-st.header("📈 Key Metrics Overview")
-df_completed = df_filtered.dropna(subset=['First Name', 'College Name', 'Gender'])
-kpi1, kpi2, kpi3 = st.columns(3)
-kpi1.metric(label="Total Registrations (Filtered)", value=f"{len(df_filtered)}")
-kpi2.metric(label="Completed Profiles", value=f"{len(df_completed)}")
-kpi3.metric(label="Top College in Selection", value=df_completed['College Name'].mode()[0], delta=f"{df_completed['College Name'].value_counts().iloc[0]} Registrations")
-st.markdown("---")
+@st.cache_data(max_entries=16, ttl=3600)
+def explode_events(_df, key):
+    """Splits the ';'-separated Registered Events into one row per event."""
+    events_df = _df.dropna(subset=['Registered Events'])
+    # Split, flatten and trim in Arrow, then repeat each registration once per
+    # event it lists so the other columns line up with the flattened tokens.
+    event_lists = pc.split_pattern(pa.array(events_df['Registered Events']), ';')
+    events = pc.utf8_trim_whitespace(pc.list_flatten(event_lists))
+    rows = np.repeat(np.arange(len(events_df)), pc.list_value_length(event_lists).to_numpy())
+    return events_df.iloc[rows].assign(**{'Registered Events': pd.arrays.ArrowStringArray(events)})
 
-st.header("Detailed Analysis")
-tab1, tab2, tab3, tab4 = st.tabs(["🗓️ Timeline", "🎓 Demographics", "📊 Event Analytics", "📋 Full Data"])
+@st.cache_data(max_entries=16, ttl=3600)
+def agg_event_summary(_events_exploded, key):
+    """Totals the participants and unique teams for each event."""
+    # One grouped pass computes both columns; nunique() already reports 0 for
+    # events whose registrations have no team.
+    event_summary_df = _events_exploded.groupby('Registered Events', sort=False, observed=True).agg(**{
+        'Total Participants': ('Registered Events', 'size'),
+        'Number of Unique Teams': ('Teams', 'nunique'),
+    })
+    event_summary_df = event_summary_df.sort_values('Total Participants', ascending=False)
+    return event_summary_df.rename_axis('Event').reset_index()
 
-with tab1:
+@st.cache_data(max_entries=16, ttl=3600)
+def agg_college_interest(_events_exploded, key):
+    """Ranks the top 10 registering colleges for every event."""
+    college_interest = {}
+    for event, group in _events_exploded.groupby('Registered Events', sort=False, observed=True):
+        top_colleges = count_values(group['College Name']).nlargest(10).reset_index()
+        top_colleges.columns = ['College', 'Registrations']
+        college_interest[event] = top_colleges
+    return college_interest
+
+@st.cache_data(max_entries=16, ttl=3600)
+def to_csv(_df, key):
+    """Converts a DataFrame to CSV bytes for downloading, minus internal columns."""
+    buffer = io.BytesIO()
+    table = pa.Table.from_pandas(_df, preserve_index=False).drop_columns(['_complete'])
+    # Registration Date is held as midnight timestamps; write it date-only.
+    date_index = table.schema.get_field_index('Registration Date')
+    table = table.set_column(date_index, 'Registration Date', table['Registration Date'].cast(pa.date32()))
+    pa_csv.write_csv(table, buffer)
+    return buffer.getvalue()
+
+# --- TAB SECTIONS ---
+# Each tab is a fragment, so interacting with a widget inside it reruns only
+# that tab instead of the whole script. Plotly is imported inside the chart
+# tabs so the upload prompt renders without waiting on it.
+@st.fragment
+def render_timeline(df_filtered, filter_key):
+    """Renders the registrations-over-time tab."""
+    import plotly.express as px
     st.subheader("Registrations Over Time")
     plot_type_timeline = st.selectbox(
         "Choose a visualization type for the timeline:",
         ("Line Chart", "Bar Chart", "Area Chart", "Data Table"),
         key='timeline_plot_selector'
     )
-    daily_registrations = df_filtered.groupby('Registration Date').size().reset_index(name='Count')
-    daily_registrations.rename(columns={'Registration Date': 'Date'}, inplace=True)
+    daily_registrations = agg_daily(df_filtered, filter_key)
     if plot_type_timeline == "Line Chart":
-        fig = px.line(daily_registrations, x='Date', y='Count', title='Daily Registration Volume', markers=True)
-        st.plotly_chart(fig, use_container_width=True)
+        fig = px.line(daily_registrations, x='Date', y='Count', title='Daily Registration Volume', markers=True, render_mode='webgl')
+        st.plotly_chart(fig, use_container_width=True, key='fig_timeline_line')
     elif plot_type_timeline == "Bar Chart":
         fig = px.bar(daily_registrations, x='Date', y='Count', title='Daily Registration Volume')
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='fig_timeline_bar')
     elif plot_type_timeline == "Area Chart":
         fig = px.area(daily_registrations, x='Date', y='Count', title='Cumulative Registration Volume', markers=True)
-        st.plotly_chart(fig, use_container_width=True)
+        st.plotly_chart(fig, use_container_width=True, key='fig_timeline_area')
     else:
-        st.dataframe(daily_registrations)
+        st.dataframe(daily_registrations, column_config={'Date': st.column_config.DateColumn(format='YYYY-MM-DD')})
 
-with tab2:
+@st.fragment
+def render_demographics(df_filtered, df_completed, filter_key, completed_key):
+    """Renders the college, year, gender and degree breakdowns."""
+    import plotly.express as px
     col1, col2 = st.columns(2)
     with col1:
         st.subheader("Top 10 Colleges")
-        college_counts = df_completed['College Name'].value_counts().nlargest(10).reset_index()
+        college_counts = agg_counts(df_completed, 'College Name', completed_key).nlargest(10).reset_index()
         college_counts.columns = ['College', 'Count']
         fig_bar_college = px.bar(college_counts, x='Count', y='College', orientation='h', title='Top Colleges')
         fig_bar_college.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_bar_college, use_container_width=True)
+        st.plotly_chart(fig_bar_college, use_container_width=True, key='fig_top_colleges')
         st.subheader("Distribution by Year of Study")
-        year_counts = df_filtered['Year of Study Cleaned'].value_counts().reset_index()
+        year_counts = agg_counts(df_filtered, 'Year of Study Cleaned', filter_key).reset_index()
         year_counts.columns = ['Year', 'Count']
         fig_pie_year = px.pie(year_counts, names='Year', values='Count', title='Proportion by Year')
-        st.plotly_chart(fig_pie_year, use_container_width=True)
+        st.plotly_chart(fig_pie_year, use_container_width=True, key='fig_year_split')
     with col2:
         st.subheader("Gender Distribution")
-        gender_counts = df_completed['Gender'].value_counts().reset_index()
+        gender_counts = agg_counts(df_completed, 'Gender', completed_key).reset_index()
         gender_counts.columns = ['Gender', 'Count']
         fig_donut_gender = px.pie(gender_counts, names='Gender', values='Count', title='Registrations by Gender', hole=0.4)
-        st.plotly_chart(fig_donut_gender, use_container_width=True)
+        st.plotly_chart(fig_donut_gender, use_container_width=True, key='fig_gender_split')
         st.subheader("Top 10 Degrees/Branches")
-        degree_counts = df_completed['Degree'].value_counts().nlargest(10).reset_index()
+        degree_counts = agg_counts(df_completed, 'Degree', completed_key).nlargest(10).reset_index()
         degree_counts.columns = ['Degree', 'Count']
         fig_bar_degree = px.bar(degree_counts, x='Count', y='Degree', orientation='h', title='Most Popular Degrees')
         fig_bar_degree.update_layout(yaxis={'categoryorder':'total ascending'})
-        st.plotly_chart(fig_bar_degree, use_container_width=True)
-
+        st.plotly_chart(fig_bar_degree, use_container_width=True, key='fig_top_degrees')
 
-with tab3:
+@st.fragment
+def render_event_analytics(df_filtered, filter_key):
+    """Renders the event popularity, team and drill-down sections."""
+    import plotly.express as px
     st.header("📊 In-Depth Event Analytics")
-    events_df = df_filtered.dropna(subset=['Registered Events']).copy()
-    events_df['Registered Events'] = events_df['Registered Events'].str.split(';')
-    events_exploded = events_df.explode('Registered Events')
-    events_exploded['Registered Events'] = events_exploded['Registered Events'].str.strip()
+    events_exploded = explode_events(df_filtered, filter_key)
     
     if events_exploded.empty:
         st.warning("No event registration data found for the current filter selection.")
@@ -150,33 +217,22 @@ with tab3:
         with st.container(border=True):
             st.subheader("Event Popularity")
             plot_type = st.selectbox("Choose a visualization type:", ("Bar Chart", "Pie Chart", "Data Table"))
-            event_counts = events_exploded['Registered Events'].value_counts().reset_index()
+            event_counts = agg_counts(events_exploded, 'Registered Events', filter_key).reset_index()
             event_counts.columns = ['Event', 'Registrations']
             if plot_type == "Bar Chart":
                 fig = px.bar(event_counts, x='Registrations', y='Event', orientation='h')
                 fig.update_layout(yaxis={'categoryorder':'total ascending'})
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='fig_event_popularity_bar')
             elif plot_type == "Pie Chart":
                 fig = px.pie(event_counts, names='Event', values='Registrations')
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='fig_event_popularity_pie')
             else:
                 st.dataframe(event_counts)
 
         with st.container(border=True):
             st.subheader("Participants and Unique Teams per Event")
+            event_summary_df = agg_event_summary(events_exploded, filter_key)
 
-            # 1. Calculate total participants per event
-            total_participants = events_exploded['Registered Events'].value_counts().reset_index()
-            total_participants.columns = ['Event', 'Total Participants']
-
-            # 2. Calculate unique teams per event
-            unique_teams = events_exploded.groupby('Registered Events')['Teams'].nunique().reset_index()
-            unique_teams.columns = ['Event', 'Number of Unique Teams']
-
-            # 3. Merge the two dataframes
-            event_summary_df = pd.merge(total_participants, unique_teams, on='Event', how='left')
-            event_summary_df['Number of Unique Teams'] = event_summary_df['Number of Unique Teams'].fillna(0).astype(int)
-            
             # Add tabs for visualization and data table
             viz_tab, data_tab = st.tabs(["📊 Charts View", "📋 Table View"])
 
@@ -193,7 +249,7 @@ with tab3:
                         title='Total Participants per Event'
                     )
                     fig_participants.update_layout(yaxis={'categoryorder':'total ascending'})
-                    st.plotly_chart(fig_participants, use_container_width=True)
+                    st.plotly_chart(fig_participants, use_container_width=True, key='fig_event_participants')
                     
                 with col2:
                     # Chart for Number of Unique Teams
@@ -206,7 +262,7 @@ with tab3:
                         title='Number of Unique Teams per Event'
                     )
                     fig_teams.update_layout(yaxis={'categoryorder':'total ascending'})
-                    st.plotly_chart(fig_teams, use_container_width=True)
+                    st.plotly_chart(fig_teams, use_container_width=True, key='fig_event_teams')
 
             with data_tab:
                 # Display the summary table
@@ -214,24 +270,109 @@ with tab3:
             
         with st.container(border=True):
             st.subheader("Drill-Down: College Interest by Event")
-            event_list = sorted(events_exploded['Registered Events'].unique())
+            # Every event is ranked up front, so switching events is a lookup.
+            college_interest_by_event = agg_college_interest(events_exploded, filter_key)
+            event_list = sorted(college_interest_by_event)
             selected_event = st.selectbox("Select an event to see college registrations:", event_list)
             if selected_event:
-                event_specific_df = events_exploded[events_exploded['Registered Events'] == selected_event]
-                college_interest = event_specific_df['College Name'].value_counts().nlargest(10).reset_index()
-                college_interest.columns = ['College', 'Registrations']
+                college_interest = college_interest_by_event[selected_event]
                 fig = px.bar(college_interest, x='Registrations', y='College', orientation='h', title=f"Top 10 Colleges Registering for {selected_event}")
                 fig.update_layout(yaxis={'categoryorder':'total ascending'})
-                st.plotly_chart(fig, use_container_width=True)
+                st.plotly_chart(fig, use_container_width=True, key='fig_event_drilldown')
 
-with tab4:
+@st.fragment
+def render_full_data(df_filtered, filter_key):
+    """Renders the filtered table and its CSV download."""
     st.subheader("Browse and Export Full Data")
-    st.dataframe(df_filtered)
-    csv = to_csv(df_filtered)
+    # Only ship a preview to the browser; the download below stays complete.
+    row_cap = 10_000
+    st.dataframe(df_filtered.head(row_cap), column_config={
+        'Registration Date': st.column_config.DateColumn(format='YYYY-MM-DD'),
+        '_complete': None,
+    })
+    if len(df_filtered) > row_cap:
+        st.caption(f"Showing the first {row_cap:,} of {len(df_filtered):,} rows. Download the CSV below for the full data.")
+    csv = to_csv(df_filtered, filter_key)
     st.download_button(
         label="📥 Download Filtered Data as CSV",
         data=csv,
         file_name='filtered_registrations.csv',
         mime='text/csv',
     )
-    
\ No newline at end of file
+
+# --- MAIN APPLICATION ---
+st.title("🎉 Event Registration Dashboard")
+st.markdown("Upload your registration CSV for an automated, in-depth analysis.")
+
+uploaded_file = st.file_uploader("Choose a CSV file", type="csv")
+
+if uploaded_file is None:
+    st.info("Please upload a CSV file to get started.", icon="👈")
+    st.stop()
+
+try:
+    # Hand the raw bytes straight to the Arrow reader: it handles \r\n line
+    # endings natively and 'utf-8-sig' strips a leading BOM from the header.
+    # Caching on the bytes keeps the cache key cheap to hash on every rerun.
+    df, min_date, max_date = load_and_preprocess(uploaded_file.getvalue())
+    if df.empty:
+        st.error("The uploaded CSV file is empty or could not be read.", icon="🚨")
+        st.stop()
+except Exception as e:
+    st.error(f"⚠️ Could not read the CSV file. Try re-saving it as UTF-8 format.\n\nError details: {e}")
+    st.stop()
+
+# --- SIDEBAR FILTERS ---
+st.sidebar.header("Filter Your Data 👇")
+college_list = df['College Name'].cat.categories.tolist()
+selected_colleges = st.sidebar.multiselect('Filter by College:', options=college_list, default=college_list)
+year_list = df['Year of Study Cleaned'].cat.categories.tolist()
+selected_years = st.sidebar.multiselect('Filter by Year of Study:', options=year_list, default=year_list)
+selected_date_range = st.sidebar.date_input('Filter by Registration Date:', value=(min_date, max_date), min_value=min_date, max_value=max_date)
+
+start_date, end_date = (pd.Timestamp(d) for d in selected_date_range)
+# Compare the raw datetime64 values directly instead of through pandas Series.
+registration_dates = df['Registration Date'].to_numpy()
+mask = np.logical_and.reduce([
+    df['College Name'].isin(set(selected_colleges)).to_numpy(),
+    df['Year of Study Cleaned'].isin(set(selected_years)).to_numpy(),
+    registration_dates >= start_date.to_datetime64(),
+    registration_dates <= end_date.to_datetime64(),
+])
+df_filtered = df.iloc[mask]
+filter_key = (uploaded_file.file_id, tuple(selected_colleges), tuple(selected_years), start_date, end_date)
+
+if df_filtered.empty:
+    st.warning("No data matches the current filter settings.")
+    st.stop()
+
+# --- DASHBOARD UI ---
+st.markdown("---")
+st.header("📈 Key Metrics Overview")
+df_completed = df_filtered[df_filtered['_complete'].to_numpy()]
+completed_key = filter_key + ('completed',)
+kpi1, kpi2, kpi3 = st.columns(3)
+kpi1.metric(label="Total Registrations (Filtered)", value=f"{len(df_filtered)}")
+kpi2.metric(label="Completed Profiles", value=f"{len(df_completed)}")
+# The same cached counts feed the Top 10 Colleges chart in the Demographics tab.
+top_colleges = agg_counts(df_completed, 'College Name', completed_key)
+if top_colleges.empty:
+    kpi3.metric(label="Top College in Selection", value="N/A")
+else:
+    kpi3.metric(label="Top College in Selection", value=top_colleges.index[0], delta=f"{top_colleges.iloc[0]} Registrations")
+st.markdown("---")
+
+st.header("Detailed Analysis")
+tab1, tab2, tab3, tab4 = st.tabs(["🗓️ Timeline", "🎓 Demographics", "📊 Event Analytics", "📋 Full Data"])
+
+with tab1:
+    render_timeline(df_filtered, filter_key)
+
+with tab2:
+    render_demographics(df_filtered, df_completed, filter_key, completed_key)
+
+with tab3:
+    render_event_analytics(df_filtered, filter_key)
+
+with tab4:
+    render_full_data(df_filtered, filter_key)